@@ -12,7 +12,9 @@ def bfs(start_state, goaltest):
     Parameters
     ----------
     start_state : State
-       State object with `successors` function.
+       State object with `successors` function. If the state class overrides
+       `encode` and `decode`, the search stores the compact codes instead of
+       the state objects.
     goaltest : Function (State -> bool)
        A function which takes a State object as parameter and returns true if 
        the state is an acceptable goal state.
@@ -28,47 +30,53 @@ def bfs(start_state, goaltest):
         return []
     
     # Otherwise...
+    # All bookkeeping is done on the encoded states (see State.encode), which
+    # for e.g. KnightsState is a single int instead of a full object.
+    decode = start_state.decode
+    start_code = start_state.encode()
     # Need to keep track of visited states to make sure that there are no loops.
     # The start_state is already checked above, so add that.
-    visited = {start_state}
+    visited = {start_code}
     # And we also need a dictionary to look up predecessor states and the
     # the actions which took us there. It is empty to start with.
     predecessor = {}
     # Use a queue to track the states which should be expanded.
     Q = Queue()
     # Initially there's only the start state.
-    Q.put(start_state)
+    Q.put(start_code)
 
     # Begin search.
     while not Q.empty():
         # Get next state to be expanded.
-        state = Q.get()
+        code = Q.get()
+        state = decode(code)
         # Check all its successor states.
         for (action,ss) in state.successors():
+            ss_code = ss.encode()
             # Only work with states not already visited.
-            if ss not in visited:
+            if ss_code not in visited:
                 # Update predecessor.
-                predecessor[ss] = (state,action)
+                predecessor[ss_code] = (code,action)
                 # Check goal.
                 if goaltest(ss):
                     # This is the state we are looking for!
                     # Create a of actions path by stepping back through
                     # the predecessors.
-                    (last_state, last_action) = predecessor[ss]
+                    (last_code, last_action) = predecessor[ss_code]
                     pi = [last_action]
                     # As long as the predecessor state is not the initial state
-                    while last_state != start_state:
+                    while last_code != start_code:
                         # Update the policy.
-                        (last_state, last_action) = predecessor[last_state]
+                        (last_code, last_action) = predecessor[last_code]
                         pi.append(last_action)
                     # Return the policy, reversed (because we constructed it
                     # from end to start state).
                     return reversed(pi)
                 # Not a goal state, need to keep searching.
                 # Mark state as visited.
-                visited.add(ss)
+                visited.add(ss_code)
                 # Enqueue successor.
-                Q.put(ss)
+                Q.put(ss_code)
     # If the queue becomes empty without the goal test triggering a return
     # there is no policy, so return None.
     return None
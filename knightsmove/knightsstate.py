@@ -65,6 +65,40 @@ class KnightsState(state.State):
                                  for c in range(8))\
                          for r in range(8))
 
+    def encode(self):
+        """
+        Encodes the board as a 64 bit integer (a bitboard).
+
+        Bit number 8*r + c is set if location (r,c) is occupied.
+
+        Returns
+        -------
+        int
+           Integer in [0, 2**64).
+        """
+        code = 0
+        for r,c in self.occupied:
+            code |= 1 << (8*r + c)
+        return code
+
+    @classmethod
+    def decode(cls, code):
+        """
+        Creates a KnightsState object from a bitboard made by `encode`.
+
+        Parameters
+        ----------
+        code : int
+           Integer in [0, 2**64) where bit number 8*r + c denotes that
+           location (r,c) is occupied.
+
+        Returns
+        -------
+        KnightsState
+           The board described by `code`.
+        """
+        return cls([(i // 8, i % 8) for i in range(64) if code >> i & 1])
+
     def successors(self):
         """
         Gives all legal moves in the current board configuration in the form of
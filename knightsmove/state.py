@@ -12,6 +12,12 @@ class State(ABC):
     The decorator @abstractmethod means that an error is raised if the
     corresponding method is not implemented when the child is instansiated.
 
+    Optionally, a state may provide a compact encoding by overriding `encode`
+    and `decode`. Search functions store the encoded form in their visited
+    sets, predecessor tables and queues, so a small code (e.g. an int) saves
+    a lot of memory compared to keeping full state objects around. The
+    default implementation simply uses the state object itself as its code.
+
     """
     
     @abstractmethod
@@ -27,3 +33,37 @@ class State(ABC):
            determined by the inheriting class.
         """
         pass
+
+    def encode(self):
+        """
+        Get a compact, hashable representation of the state.
+
+        Two states must have the same code if and only if they are equal.
+        The default implementation returns the state itself.
+
+        Returns
+        -------
+        hashable (e.g. int or bytes)
+           Code from which `decode` can recreate the state.
+        """
+        return self
+
+    @classmethod
+    def decode(cls, code):
+        """
+        Recreate a state from a code produced by `encode`.
+
+        The default implementation returns the code itself, matching the
+        default `encode`.
+
+        Parameters
+        ----------
+        code : hashable
+           Code returned by `encode` of a state of this class.
+
+        Returns
+        -------
+        State
+           State equal to the one that was encoded.
+        """
+        return code
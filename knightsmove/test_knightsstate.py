@@ -153,5 +153,37 @@ class TestKnightsStateBasics(unittest.TestCase):
         ks2 = KnightsState(occ2)
         self.assertNotEqual(ks2,ks1a)
 
+class TestKnightsStateEncoding(unittest.TestCase):
+    """
+    Test encode/decode of boards.
+    """
+
+    def test_encode_empty_and_full(self):
+        """The empty board is 0 and the full board has all 64 bits set."""
+        self.assertEqual(0, KnightsState([]).encode())
+        full = KnightsState([(r,c) for r in range(8) for c in range(8)])
+        self.assertEqual(2**64 - 1, full.encode())
+
+    def test_encode_location(self):
+        """Location (r,c) corresponds to bit number 8*r + c."""
+        self.assertEqual(1 << 0, KnightsState([(0,0)]).encode())
+        self.assertEqual(1 << 10, KnightsState([(1,2)]).encode())
+        self.assertEqual(1 << 63, KnightsState([(7,7)]).encode())
+
+    def test_roundtrip(self):
+        """Decoding an encoded board gives back an equal board."""
+        for occ in [[], [(4,4)], [(5,7), (0,1), (4,2)],
+                    [(r,c) for r in range(8) for c in range(8)]]:
+            ks = KnightsState(occ)
+            self.assertEqual(ks, KnightsState.decode(ks.encode()))
+
+    def test_encode_equality(self):
+        """Codes are equal if and only if the boards are equal."""
+        ks1a = KnightsState([(4,5),(2,2)])
+        ks1b = KnightsState([(2,2),(4,5)])
+        ks2 = KnightsState([(5,4),(2,2)])
+        self.assertEqual(ks1a.encode(), ks1b.encode())
+        self.assertNotEqual(ks1a.encode(), ks2.encode())
+
 if __name__ == "__main__":
     unittest.main()